@@ -74,6 +74,20 @@ CATEGORY_FIELDS = {
 # 注意：如果你希望允许更多字段，只需要调大这个值即可。
 MAX_DYNAMIC_FIELDS = 10
 
+# “物品列表”页每次显示的物品数量（点击“加载更多”再追加一页），避免物品很多时一次渲染/传输全部卡片
+ITEMS_PAGE_SIZE = 50
+
+# 物品卡片使用的缩略图最大边长（像素）；原图仍保留在 images/ 目录
+THUMBNAIL_SIZE = 400
+
+# Gradio 事件队列：同一事件默认只允许 1 个并发，这里放宽到多个，让查询/审批等 I/O 型回调可以并行；
+# 排队请求数设上限，超出时直接提示繁忙而不是无限堆积
+QUEUE_CONCURRENCY_LIMIT = 8
+QUEUE_MAX_SIZE = 64
+
+# 执行同步回调的线程池大小（anyio 默认 40）
+THREADPOOL_SIZE = 64
+
 DATA_FILE = "items.json"
 USERS_FILE = "users.json"
 IMAGE_DIR = "images"
@@ -1,18 +1,28 @@
 import sqlite3
-import json
 import os
+from operator import itemgetter
+
+import orjson
+
+from utils.database import hash_password
 
 # 定义数据库文件名
 DB_FILE = "CS3331.db"
 
 # # 如果数据库文件已存在，先删除，确保每次运行都是全新的
-if os.path.exists(DB_FILE):
-    os.remove(DB_FILE)
+# 连同 WAL 模式留下的 -wal / -shm 文件一起删除，避免旧日志被回放到新库上
+for path in (DB_FILE, DB_FILE + "-wal", DB_FILE + "-shm"):
+    if os.path.exists(path):
+        os.remove(path)
 
 # 1. 连接数据库（会自动创建文件）
 conn = sqlite3.connect(DB_FILE)
 cursor = conn.cursor()
 
+# 批量导入：WAL 模式 + 关闭同步刷盘（初始化脚本失败重跑即可），所有插入放在同一个事务中
+conn.execute("PRAGMA journal_mode=WAL")
+conn.execute("PRAGMA synchronous=OFF")
+
 # ---------------------------------------------------------
 # 2. 创建表结构 (SQL 语句)
 # ---------------------------------------------------------
@@ -50,34 +60,49 @@ cursor.execute(
 """
 )
 
+# 导入时的列顺序（与下面 INSERT 语句一致）
+USER_COLUMNS = ("id", "username", "password", "role", "status", "contact", "address")
+ITEM_COLUMNS = (
+    "id",
+    "name",
+    "category",
+    "description",
+    "contact",
+    "image",
+    "create_time",
+    "address",
+    "attributes",
+)
+
 # ---------------------------------------------------------
 # 3. 读取 users.json 并写入数据库
 # ---------------------------------------------------------
 try:
-    with open("users.json", "r", encoding="utf-8") as f:
-        users_data = json.load(f)
+    # orjson 直接解析 UTF-8 字节，比标准库 json 更快
+    with open("users.json", "rb") as f:
+        users_data = orjson.loads(f.read())
         # print(users_data)
         # [{'id': 1, 'username': 'admin', 'password': 'admin123', 'role': 'admin', 'status': 'approved'}, {'id': 2, 'username': 'user1', 'password': 'password1', 'role': 'user', 'status': 'approved'}, {'id': 3, 'username': 'user2', 'password': 'password2', 'role': 'user', 'status': 'pending'}]
 
-        user_rows = []
-        for user in users_data:
-            row = (
-                user.get("id"),
-                user.get("username"),
-                user.get("password"),
-                user.get("role", "user"),  # 默认值 'user'
-                user.get("status", "pending"),  # 默认值 'pending'
-                user.get("contact"),
-                user.get("address"),
-            )
-            user_rows.append(row)
-
-        # 批量插入
+    # 先与默认值合并（缺失字段为 None，role 默认 'user'，status 默认 'pending'），
+    # 再用 itemgetter 一次取出整行；生成器直接交给 executemany，不构造完整的元组列表
+    user_defaults = dict.fromkeys(USER_COLUMNS) | {"role": "user", "status": "pending"}
+    get_user_row = itemgetter(*USER_COLUMNS)
+    # users.json 中是明文密码，入库前统一转为摘要
+    user_rows = (
+        get_user_row(
+            user_defaults | user | {"password": hash_password(user.get("password", ""))}
+        )
+        for user in users_data
+    )
+
+    # 批量插入（单个事务）
+    with conn:
         cursor.executemany(
             "INSERT INTO users (id, username, password, role, status, contact, address) VALUES (?, ?, ?, ?, ?, ?, ?)",
             user_rows,
         )
-        print(f"成功插入 {len(user_rows)} 条用户数据。")
+    print(f"成功插入 {cursor.rowcount} 条用户数据。")
 
 except FileNotFoundError:
     print("未找到 users.json，跳过用户数据导入。")
@@ -86,27 +111,16 @@ except FileNotFoundError:
 # 4. 读取 items.json 并写入数据库
 # ---------------------------------------------------------
 try:
-    with open("items.json", "r", encoding="utf-8") as f:
-        items_data = json.load(f)  # 这是一个列表 [{}, {}, ...]
-
-        item_rows = []
-        for item in items_data:
-            # 使用 .get() 方法，因为 image 可能不存在
-            # 如果不存在，这就返回 None，数据库里会存为 NULL
-            row = (
-                item.get("id"),
-                item.get("name"),
-                item.get("category"),
-                item.get("description"),
-                item.get("contact"),
-                item.get("image", None),  # 默认值为 None
-                item.get("create_time"),
-                item.get("address"),
-                item.get("attributes", None),
-            )
-            item_rows.append(row)
-
-        # 批量插入
+    with open("items.json", "rb") as f:
+        items_data = orjson.loads(f.read())  # 这是一个列表 [{}, {}, ...]
+
+    # image 等字段可能不存在：与全 None 的默认值合并后，数据库里会存为 NULL
+    item_defaults = dict.fromkeys(ITEM_COLUMNS)
+    get_item_row = itemgetter(*ITEM_COLUMNS)
+    item_rows = (get_item_row(item_defaults | item) for item in items_data)
+
+    # 批量插入（单个事务）
+    with conn:
         cursor.executemany(
             """
             INSERT INTO items (id, name, category, description, contact, image, create_time, address, attributes) 
@@ -114,7 +128,7 @@ try:
         """,
             item_rows,
         )
-        print(f"成功插入 {len(item_rows)} 条物品数据。")
+    print(f"成功插入 {cursor.rowcount} 条物品数据。")
 
 except FileNotFoundError:
     print("未找到 items.json，跳过物品数据导入。")
@@ -1,12 +1,16 @@
-import json
+import orjson
 import html
 import os
 import shutil
 from datetime import datetime
 from dotenv import load_dotenv
 import traceback
+from contextlib import asynccontextmanager
+from functools import lru_cache
 
+import anyio
 import gradio as gr
+from PIL import Image, ImageOps
 from fastapi import FastAPI
 import uvicorn
 
@@ -14,12 +18,13 @@ from utils.contact import format_contact
 from utils.auth import show_welcome
 from utils.util import *
 from utils.database import (
-    _get_db_connection,
+    _get_read_connection,
     _ensure_db_schema,
     load_users,
     add_user,
     load_items,
-    save_items,
+    insert_item,
+    delete_item_record,
     authenticate_user,
     register_user,
     list_pending_users,
@@ -37,6 +42,10 @@ from constants import USERS_FILE  # 用户数据存储文件路径 (users.json)
 from constants import IMAGE_DIR  # 图片存储目录路径 (images/)
 from constants import DB_FILE  # SQLite 数据库文件路径 (CS3331.db)
 from constants import MAX_DYNAMIC_FIELDS
+from constants import ITEMS_PAGE_SIZE  # 物品列表每页显示数量
+from constants import THUMBNAIL_SIZE  # 卡片缩略图最大边长
+from constants import QUEUE_CONCURRENCY_LIMIT, QUEUE_MAX_SIZE  # Gradio 队列并发配置
+from constants import THREADPOOL_SIZE  # 同步回调线程池大小
 
 from utils import category_config
 
@@ -44,13 +53,16 @@ from utils import category_config
 IMAGE_DIR = get_path_for_write(IMAGE_DIR)
 DB_FILE = get_path_for_write(DB_FILE)
 
-# 创建图片存储目录（如果不存在）
-if not os.path.exists(IMAGE_DIR):
-    os.makedirs(IMAGE_DIR)
+# 创建图片存储目录（如果不存在；只在启动时执行一次）
+os.makedirs(IMAGE_DIR, exist_ok=True)
+
+
+@lru_cache(maxsize=1)
+def _load_css():
+    """从文件中读取自定义 CSS 样式（只读一次，主应用与注册页共用）"""
+    with open(get_path_for_read("style.css"), "r", encoding="utf-8") as f:
+        return f.read()
 
-# 从文件中读取自定义 CSS 样式
-with open(get_path_for_read("style.css"), "r", encoding="utf-8") as f:
-    custom_css = f.read()
 
 _ensure_db_schema(DB_FILE)
 
@@ -58,7 +70,16 @@ _ensure_db_schema(DB_FILE)
 MAIN_PATH = "/home"  # 主应用（需要登录）
 REGISTER_PATH = "/register"  # 注册页（无需登录）
 
-app = FastAPI()
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    # Gradio 的同步回调（数据库查询、HTML 渲染）在 anyio 线程池里执行，默认最多 40 个线程；
+    # 启动时调大上限，避免并发请求多时排队等线程
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    yield
+
+
+app = FastAPI(lifespan=_lifespan)
 
 from fastapi.responses import HTMLResponse
 
@@ -71,41 +92,45 @@ from fastapi.responses import HTMLResponse
 #     }
 
 
+# 入口页只依赖 MAIN_PATH/REGISTER_PATH 两个常量，导入时生成一次，每次请求直接返回
+_INDEX_HTML = f"""
+<!DOCTYPE html>
+<html>
+    <head>
+        <title>系统入口</title>
+        <style>
+            body {{ font-family: -apple-system, sans-serif; display: flex; justify-content: center; align-items: center; height: 100vh; margin: 0; background-color: #f5f7f9; }}
+            .container {{ text-align: center; background: white; padding: 2rem; border-radius: 12px; shadow: 0 4px 6px rgba(0,0,0,0.1); box-shadow: 0 10px 25px rgba(0,0,0,0.05); }}
+            h1 {{ color: #2d3748; margin-bottom: 1.5rem; }}
+            .btn-group {{ display: flex; gap: 1rem; justify-content: center; }}
+            .btn {{ padding: 12px 24px; border-radius: 8px; text-decoration: none; font-weight: bold; transition: all 0.2s; }}
+            .btn-main {{ background-color: #4299e1; color: white; }}
+            .btn-main:hover {{ background-color: #3182ce; }}
+            .btn-reg {{ background-color: #edf2f7; color: #4a5568; }}
+            .btn-reg:hover {{ background-color: #e2e8f0; }}
+            p {{ color: #718096; margin-bottom: 2rem; }}
+        </style>
+    </head>
+    <body>
+        <div class="container">
+            <h1>欢迎使用物品复活平台</h1>
+            <p>请根据您的需求选择进入的页面</p>
+            <div class="btn-group">
+                <a href="{MAIN_PATH}" class="btn btn-main">进入主应用 (需要登录)</a>
+                <a href="{REGISTER_PATH}" class="btn btn-reg">新用户注册</a>
+            </div>
+        </div>
+    </body>
+</html>
+"""
+
+
 @app.get("/", response_class=HTMLResponse)
 def read_main():
-    return f"""
-    <!DOCTYPE html>
-    <html>
-        <head>
-            <title>系统入口</title>
-            <style>
-                body {{ font-family: -apple-system, sans-serif; display: flex; justify-content: center; align-items: center; height: 100vh; margin: 0; background-color: #f5f7f9; }}
-                .container {{ text-align: center; background: white; padding: 2rem; border-radius: 12px; shadow: 0 4px 6px rgba(0,0,0,0.1); box-shadow: 0 10px 25px rgba(0,0,0,0.05); }}
-                h1 {{ color: #2d3748; margin-bottom: 1.5rem; }}
-                .btn-group {{ display: flex; gap: 1rem; justify-content: center; }}
-                .btn {{ padding: 12px 24px; border-radius: 8px; text-decoration: none; font-weight: bold; transition: all 0.2s; }}
-                .btn-main {{ background-color: #4299e1; color: white; }}
-                .btn-main:hover {{ background-color: #3182ce; }}
-                .btn-reg {{ background-color: #edf2f7; color: #4a5568; }}
-                .btn-reg:hover {{ background-color: #e2e8f0; }}
-                p {{ color: #718096; margin-bottom: 2rem; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <h1>欢迎使用物品复活平台</h1>
-                <p>请根据您的需求选择进入的页面</p>
-                <div class="btn-group">
-                    <a href="{MAIN_PATH}" class="btn btn-main">进入主应用 (需要登录)</a>
-                    <a href="{REGISTER_PATH}" class="btn btn-reg">新用户注册</a>
-                </div>
-            </div>
-        </body>
-    </html>
-    """
+    return _INDEX_HTML
 
 
-def authenticate(username, password):
+async def authenticate(username, password):
     """
     验证用户登录凭证
 
@@ -115,11 +140,17 @@ def authenticate(username, password):
 
     返回值:
         bool: 验证成功返回 True，失败返回 False
+
+    说明:
+        Gradio 的 /login 路由是 async 函数，同步的 auth 函数会直接在事件循环里执行；
+        这里把可能查询数据库的校验放到线程池中，登录请求较多时不阻塞其他请求
     """
     # 仅允许已通过管理员审批 (status=approved) 的用户登录
     if not username or not password:
         return False
-    return authenticate_user(username, password, DB_FILE, require_approved=True)
+    return await anyio.to_thread.run_sync(
+        authenticate_user, username, password, DB_FILE, True
+    )
 
 
 def _is_admin_request(request: gr.Request | None) -> bool:
@@ -136,8 +167,22 @@ def _is_admin_request(request: gr.Request | None) -> bool:
     return bool(me and me.get("role") == "admin")
 
 
+# (待审批列表对象, HTML)：list_pending_users 在数据未变时返回同一个列表，据此复用上次的 HTML
+# 两者作为一个元组整体替换，并发请求不会读到“新列表 + 旧 HTML”的组合
+_pending_users_html = {"entry": (None, None)}
+
+
 def _render_pending_users_html():
     pending = list_pending_users(DB_FILE)
+    cached_pending, cached_html = _pending_users_html["entry"]
+    if pending is cached_pending:
+        return cached_html
+    html_text = _build_pending_users_html(pending)
+    _pending_users_html["entry"] = (pending, html_text)
+    return html_text
+
+
+def _build_pending_users_html(pending):
     if not pending:
         return "<div style='padding: 12px; color: #666;'>暂无待审批用户</div>"
 
@@ -209,16 +254,17 @@ def _init_admin_tab(request: gr.Request | None):
     return gr.update(visible=visible), _render_pending_users_html()
 
 
-def save_image(image, item_id):
+def save_image(image, item_id, now=None):
     """
     保存上传的图片到指定目录
 
     功能说明:
-        将用户上传的图片复制到 images/ 目录，并按规则命名
+        将用户上传的图片保存到 images/ 目录（硬链接或复制），并按规则命名
 
     输入参数:
         image (str): 上传图片的临时文件路径
         item_id (int): 物品ID，用于生成唯一文件名
+        now (datetime|None): 时间戳来源；add_item 传入创建时间，避免重复取当前时间
 
     返回值:
         str: 保存后的图片相对路径
@@ -232,22 +278,67 @@ def save_image(image, item_id):
     异常处理:
         如果图片没有扩展名，默认使用 .jpg
     """
+    filepath = _image_filepath(image, item_id, now)
+
+    # 保存图片到存储目录：同一文件系统上优先建立硬链接（不复制任何数据），
+    # 跨文件系统或不支持硬链接时（OSError）退回到复制
+    try:
+        os.link(image, filepath)
+    except OSError:
+        shutil.copyfile(image, filepath)
+    # shutil (shell utilities) 是 Python 的高级文件操作模块，专门用于文件和目录的复制、移动、删除等操作。
+    # shutil.copyfile() 的功能
+    # 只复制文件内容（不像 shutil.copy 那样再复制一次权限位，上传的临时文件权限没有意义）
+    # Linux 上走 os.sendfile、macOS 上走 fcopyfile 的内核快速路径，数据不经过 Python 缓冲区
+    # 自动处理文件打开/关闭
+    # 跨平台兼容（Windows/Linux/Mac）
+
+    # 图片刚写入，直接记录其绝对路径，渲染时无需再 exists/abspath
+    _image_abs_paths[filepath] = os.path.abspath(filepath).replace("\\", "/")
+    return filepath
+
+
+def _image_filepath(image, item_id, now=None):
+    """图片在 images/ 目录中的保存路径（save_image 与生成缩略图共用同一规则）"""
     # 生成时间戳
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = (now or datetime.now()).strftime("%Y%m%d_%H%M%S")
     ext = os.path.splitext(image)[1] or ".jpg"
     # 将文件路径分割成文件名和扩展名两部分，返回元组 (文件名, 扩展名)。没有扩展名时返回空字符串
     # 取元组的第二个元素（索引为1），即扩展名部分。如果扩展名为空字符串（布尔值为 False），则使用默认值 .jpg
     filename = f"item_{item_id}_{timestamp}{ext}"
-    filepath = os.path.join(IMAGE_DIR, filename)
+    return os.path.join(IMAGE_DIR, filename)
 
-    # 复制图片到存储目录
-    shutil.copy(image, filepath)
-    # shutil (shell utilities) 是 Python 的高级文件操作模块，专门用于文件和目录的复制、移动、删除等操作。
-    # shutil.copy() 的功能
-    # 复制文件内容和权限
-    # 自动处理文件打开/关闭
-    # 跨平台兼容（Windows/Linux/Mac）
-    return filepath
+
+def _thumbnail_path(image_path):
+    """缩略图路径：与原图同目录，文件名加 _thumb 后缀，统一为 webp 格式"""
+    return os.path.splitext(image_path)[0] + "_thumb.webp"
+
+
+def _save_thumbnail(image_path):
+    """
+    为图片生成卡片用的缩略图（最长边 THUMBNAIL_SIZE 像素）
+
+    物品列表里每张卡片只显示一个小图，直接引用原图（手机照片通常有数 MB）
+    会让每次打开列表都传输完整的大图；缩略图通常只有几十 KB。
+    生成失败（格式无法识别等）时不影响保存，卡片退回使用原图。
+    """
+    thumb_path = _thumbnail_path(image_path)
+    try:
+        with Image.open(image_path) as im:
+            # JPEG 解码时直接按 1/2、1/4、1/8 缩小（仍不小于目标尺寸），大照片解码快得多
+            if im.format == "JPEG":
+                im.draft("RGB", (THUMBNAIL_SIZE, THUMBNAIL_SIZE))
+            # 按 EXIF 方向旋转，避免手机照片缩略图方向不对
+            im = ImageOps.exif_transpose(im)
+            im.thumbnail((THUMBNAIL_SIZE, THUMBNAIL_SIZE))
+            if im.mode not in ("RGB", "RGBA"):
+                im = im.convert("RGBA" if "A" in im.getbands() else "RGB")
+            im.save(thumb_path, "WEBP", quality=80)
+    except Exception:
+        return None
+
+    _image_abs_paths[thumb_path] = os.path.abspath(thumb_path).replace("\\", "/")
+    return thumb_path
 
 
 def delete_image(image_path):
@@ -268,33 +359,122 @@ def delete_image(image_path):
         使用 try-except 捕获删除失败的情况，确保程序不会因此中断
         可能的失败原因: 文件不存在、权限不足等
     """
-    if image_path and os.path.exists(image_path):
-        try:
-            os.remove(image_path)
-        except Exception:
-            pass
+    if not image_path:
+        return
+    # 连同缩略图一起删除
+    for path in (image_path, _thumbnail_path(image_path)):
+        _image_abs_paths.pop(path, None)
+        if os.path.exists(path):
+            try:
+                os.remove(path)
+            except Exception:
+                pass
+
+
+# 图片路径 -> 供 /gradio_api/file= 使用的绝对路径（图片不存在时为 None）
+# 新图片在 save_image 时写入；旧数据在首次渲染时由一次目录扫描批量补齐；delete_image 时移除
+_image_abs_paths = {}
+_image_dir_state = {"scanned": False}
+
+
+def _scan_image_dir():
+    """用一次 os.scandir 登记图片目录下的全部文件，代替逐个物品 exists/abspath"""
+    _image_dir_state["scanned"] = True
+    image_dir_abs = os.path.abspath(IMAGE_DIR).replace("\\", "/")
+    with os.scandir(IMAGE_DIR) as entries:
+        for entry in entries:
+            if entry.is_file():
+                _image_abs_paths.setdefault(
+                    os.path.join(IMAGE_DIR, entry.name),
+                    f"{image_dir_abs}/{entry.name}",
+                )
 
 
+def _get_image_abs_path(image_path):
+    """返回图片的绝对路径（正斜杠形式），每个路径只做一次 exists/abspath"""
+    if image_path in _image_abs_paths:
+        return _image_abs_paths[image_path]
+
+    # 首次未命中时扫描一次图片目录，之后图片目录内的路径都直接命中
+    if not _image_dir_state["scanned"]:
+        _scan_image_dir()
+        if image_path in _image_abs_paths:
+            return _image_abs_paths[image_path]
+
+    # 不在图片目录下的路径（如旧数据的相对路径写法）：单独检查一次
+    abs_path = None
+    if os.path.exists(image_path):
+        # 把字符串中的所有反斜杠 \ 替换成正斜杠 /
+        # 在 Python 字符串中，\ 是转义字符，需要用 \\ 表示一个真正的反斜杠
+        abs_path = os.path.abspath(image_path).replace("\\", "/")
+    _image_abs_paths[image_path] = abs_path
+    return abs_path
+
+
+@lru_cache(maxsize=2048)
 def _parse_attributes(attributes_text):
+    """解析属性 JSON，返回 (key, value) 元组（不可变，可安全地在缓存中共享）"""
     if not attributes_text:
-        return {}
+        return ()
     try:
-        value = json.loads(attributes_text)
-        return value if isinstance(value, dict) else {}
+        value = orjson.loads(attributes_text)
+        return tuple(value.items()) if isinstance(value, dict) else ()
     except Exception:
-        return {}
+        return ()
+
+
+# 渲染缓存所基于的类别配置对象：category_config.load_config() 在配置文件未变化时
+# 返回同一个对象，据此发现配置变化（包括手动编辑 category_config.json）
+_render_config = {"config": None}
+
+
+def _sync_category_config():
+    """类别配置对象变化时清空所有依赖字段定义的渲染缓存（各渲染入口先调用）"""
+    config = category_config.load_config()
+    if config is not _render_config["config"]:
+        _invalidate_render_caches()
+        _render_config["config"] = config
+
+
+# 类别 -> 字段定义列表；类别配置变化时随渲染缓存一起清空
+# （category_config.get_category_fields() 每次都会读取并校验配置文件）
+_field_defs = {}
 
 
+def _get_field_defs(category):
+    """返回类别的字段定义列表，每个类别只从配置中读取一次（调用方只读）"""
+    defs = _field_defs.get(category)
+    if defs is None:
+        defs = category_config.get_category_fields().get(category, [])
+        _field_defs[category] = defs
+    return defs
+
+
+# 类别 -> {字段 key: 展示名}；类别配置变化时随渲染缓存一起清空
+_label_maps = {}
+
+
+def _get_label_by_key(category):
+    """返回类别的字段展示名映射，每个类别只构建一次"""
+    label_by_key = _label_maps.get(category)
+    if label_by_key is None:
+        defs = _get_field_defs(category)
+        label_by_key = {d.get("key"): d.get("label", d.get("key")) for d in defs}
+        _label_maps[category] = label_by_key
+    return label_by_key
+
+
+@lru_cache(maxsize=4096)
 def _render_attributes_html(category, attributes_text):
+    """渲染物品的动态属性；按 (类别, 属性 JSON) 缓存，类别配置变化时清空"""
     attrs = _parse_attributes(attributes_text)
     if not attrs:
         return ""
 
-    defs = category_config.get_category_fields().get(category, [])
-    label_by_key = {d.get("key"): d.get("label", d.get("key")) for d in defs}
+    label_by_key = _get_label_by_key(category)
 
     parts = []
-    for k, v in attrs.items():
+    for k, v in attrs:
         if v is None or str(v).strip() == "":
             continue
         label = label_by_key.get(k, k)
@@ -308,40 +488,44 @@ def _render_attributes_html(category, attributes_text):
     return "<div>" + " &nbsp; ".join(parts) + "</div>"
 
 
+# 类别 -> 每个动态属性输入框的 (label, visible)；类别配置变化时随渲染缓存一起清空
+_field_specs = {}
+
+
+def _get_field_specs(category):
+    """返回类别对应的 MAX_DYNAMIC_FIELDS 个输入框规格，每个类别只计算一次"""
+    specs = _field_specs.get(category)
+    if specs is None:
+        defs = _get_field_defs(category)
+        specs = []
+        for i in range(MAX_DYNAMIC_FIELDS):
+            if i < len(defs):
+                d = defs[i]
+                label = d.get("label", d.get("key", "属性"))
+                required = d.get("required", False)
+                specs.append((f"{label}{'*' if required else ''}", True))
+            else:
+                specs.append(("属性", False))
+        specs = tuple(specs)
+        _field_specs[category] = specs
+    return specs
+
+
 def _category_field_updates(category):
-    defs = category_config.get_category_fields().get(category, [])
-    updates = []
-    for i in range(MAX_DYNAMIC_FIELDS):
-        if i < len(defs):
-            d = defs[i]
-            label = d.get("label", d.get("key", "属性"))
-            required = d.get("required", False)
-            updates.append(
-                gr.update(
-                    visible=True,
-                    label=f"{label}{'*' if required else ''}",
-                    value="",
-                )
-            )
-        else:
-            updates.append(gr.update(visible=False, label="属性", value=""))
-    return updates
+    # Gradio 处理 update 字典时会原地 pop 其中的 value，因此每次都新建字典，只缓存规格
+    _sync_category_config()
+    return [
+        gr.update(visible=visible, label=label, value="")
+        for label, visible in _get_field_specs(category)
+    ]
 
 
 def _category_field_initial_props(category):
-    defs = category_config.get_category_fields().get(category, [])
-    props = []
-    for i in range(MAX_DYNAMIC_FIELDS):
-        if i < len(defs):
-            d = defs[i]
-            label = d.get("label", d.get("key", "属性"))
-            required = d.get("required", False)
-            props.append(
-                {"label": f"{label}{'*' if required else ''}", "visible": True}
-            )
-        else:
-            props.append({"label": "属性", "visible": False})
-    return props
+    _sync_category_config()
+    return [
+        {"label": label, "visible": visible}
+        for label, visible in _get_field_specs(category)
+    ]
 
 
 # 在 click 事件中返回空值来清空输入框。
@@ -351,17 +535,14 @@ def add_item(name, category, description, address, contact, image, *dynamic_valu
     )
 
     # 规范化动态字段输出长度（用于 UI 回填/清空）
-    dynamic_values = list(dynamic_values)
-    if len(dynamic_values) < MAX_DYNAMIC_FIELDS:
-        dynamic_values.extend([""] * (MAX_DYNAMIC_FIELDS - len(dynamic_values)))
-    else:
-        dynamic_values = dynamic_values[:MAX_DYNAMIC_FIELDS]
+    dynamic_values = list(dynamic_values[:MAX_DYNAMIC_FIELDS])
+    dynamic_values += [""] * (MAX_DYNAMIC_FIELDS - len(dynamic_values))
 
     # 验证必填字段
     if not name or not contact:
         return (
             "❌ 物品名称和联系方式不能为空！",
-            get_items_list(),
+            gr.skip(),  # 数据未变化，列表无需重新渲染
             name,
             category,
             description,
@@ -372,7 +553,8 @@ def add_item(name, category, description, address, contact, image, *dynamic_valu
         )
 
     # 打包动态属性（写死配置驱动）
-    field_defs = category_config.get_category_fields().get(category, [])
+    _sync_category_config()
+    field_defs = _get_field_defs(category)
     attributes = {}
     missing_required = []
     for idx, d in enumerate(field_defs):
@@ -388,7 +570,7 @@ def add_item(name, category, description, address, contact, image, *dynamic_valu
     if missing_required:
         return (
             "❌ 请填写必填属性：" + "、".join(missing_required),
-            get_items_list(),
+            gr.skip(),
             name,
             category,
             description,
@@ -398,35 +580,31 @@ def add_item(name, category, description, address, contact, image, *dynamic_valu
             *dynamic_values,
         )
 
-    _ensure_db_schema(DB_FILE)
-
-    with _get_db_connection(DB_FILE) as conn:
-        # 生成新物品ID（保持与原 JSON 版本一致的“max + 1”策略）
-        new_id = conn.execute(
-            "SELECT COALESCE(MAX(id), 0) + 1 AS next_id FROM items"
-        ).fetchone()["next_id"]
-
-        # 保存图片（如果有）
-        image_path = save_image(image, new_id) if image else None
-
-        now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        conn.execute(
-            """
-            INSERT INTO items (id, name, description, address, contact, create_time, category, image, attributes)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                new_id,
-                name,
-                description,
-                address,
-                contact,
-                now_str,
-                category,
-                image_path,
-                json.dumps(attributes, ensure_ascii=False),
-            ),
-        )
+    # 物品ID由数据库分配（INTEGER PRIMARY KEY），不再先查询 MAX(id) + 1；
+    # 图片文件名需要用到 ID，因此交给 insert_item 在同一事务内保存图片（如果有）
+    # 创建时间与图片文件名的时间戳取自同一时刻，只调用一次 datetime.now()
+    now = datetime.now()
+    now_str = now.strftime("%Y-%m-%d %H:%M:%S")
+    new_id = insert_item(
+        {
+            "name": name,
+            "description": description,
+            "address": address,
+            "contact": contact,
+            "create_time": now_str,
+            "category": category,
+            # orjson 直接输出 UTF-8（中文不转义），decode 成 str 存入 TEXT 列
+            "attributes": orjson.dumps(attributes).decode(),
+        },
+        DB_FILE,
+        image_saver=(
+            (lambda item_id: save_image(image, item_id, now)) if image else None
+        ),
+    )
+    # 缩略图在写事务提交、释放数据库写锁之后再生成（解码/缩放大图较慢，不应阻塞其他写入）；
+    # 放在 get_items_list() 之前，新卡片渲染时就能用上缩略图
+    if image:
+        _save_thumbnail(_image_filepath(image, new_id, now))
 
     # 返回成功消息和清空的输入框
     return (
@@ -455,7 +633,7 @@ def delete_item(item_id):
     返回值:
         tuple: 包含3个元素的元组
             (0) str: 操作结果消息
-            (1) str: 更新后的物品列表HTML
+            (1) str: 更新后的物品列表HTML（输入校验失败时为 gr.skip()，不重新渲染）
             (2) str: 清空后的ID输入框
 
     数据验证:
@@ -465,10 +643,9 @@ def delete_item(item_id):
 
     业务逻辑:
         1. 验证输入的ID格式
-        2. 查找对应的物品记录
+        2. 从数据库删除记录（同时取回图片路径）
         3. 删除关联的图片文件
-        4. 从数据库删除记录
-        5. 返回操作结果
+        4. 返回操作结果
 
     异常处理:
         - 捕获 ValueError（ID不是数字）
@@ -476,41 +653,142 @@ def delete_item(item_id):
     """
     # 验证ID不为空
     if not item_id:
-        return ("❌ 请输入要删除的物品ID！", get_items_list(), item_id)
+        return ("❌ 请输入要删除的物品ID！", gr.skip(), item_id)
 
     try:
         # 转换为整数
         item_id = int(item_id)
 
-        _ensure_db_schema(DB_FILE)
-        with _get_db_connection(DB_FILE) as conn:
-            row = conn.execute(
-                "SELECT image FROM items WHERE id = ?", (item_id,)
-            ).fetchone()
-            if not row:
-                return (
-                    "❌ 物品ID不存在！",
-                    get_items_list(),
-                    item_id,
-                )
-
-            # 删除关联图片
-            image_path = row["image"]
-            if image_path:
-                delete_image(image_path)
+        found, image_path = delete_item_record(item_id, DB_FILE)
+        if not found:
+            return (
+                "❌ 物品ID不存在！",
+                get_items_list(),
+                item_id,
+            )
 
-            conn.execute("DELETE FROM items WHERE id = ?", (item_id,))
+        # 记录删除成功后再删除关联图片
+        if image_path:
+            delete_image(image_path)
+        _card_cache.pop(item_id, None)
 
         return (f"✅ 成功删除ID为 {item_id} 的物品", get_items_list(), "")
 
     except ValueError:
-        return ("❌ 物品ID必须是数字！", get_items_list(), item_id)
+        return ("❌ 物品ID必须是数字！", gr.skip(), item_id)
 
 
 # ==================== 界面显示与渲染模块 ====================
 
 
-def get_items_list():
+# 单个物品卡片的 HTML 缓存：{item_id: (signature, html)}
+# 物品内容不变时直接复用上次的渲染结果（同时省掉图片的 os.path.exists/abspath 调用）
+_card_cache = {}
+
+
+# 物品卡片模板（模块加载时定义一次，渲染时用 format_map 填充）
+_CARD_TPL = """
+        <div class="item-card">
+            {image_tag}
+            <div class="item-category">🏷️ {category}</div>
+            <div class="item-id">ID: {id}</div>
+            <div class="item-name">{name}</div>
+            <div class="item-desc">{description}</div>
+            {attrs_html}
+            {contact_html}
+            <div class="item-time">⏰ {create_time}</div>
+        </div>
+        """
+
+# 无图片时显示的占位符
+_NO_IMAGE_TAG = '<div class="item-image" style="background: #f5f5f5; display: flex; align-items: center; justify-content: center; color: #999;">暂无图片</div>'
+
+
+def _render_item_card(item):
+    """
+    渲染单个物品卡片的 HTML（get_items_list 与 search_items 共用）
+
+    图片处理:
+        使用 Gradio 的文件访问 API: /gradio_api/file={绝对路径}
+        需配合 app.launch(allowed_paths=[...]) 使用
+    """
+    # 处理物品图片：优先使用缩略图，旧数据没有缩略图时使用原图
+    image_abs_path = None
+    if item.get("image"):
+        image_abs_path = _get_image_abs_path(
+            _thumbnail_path(item["image"])
+        ) or _get_image_abs_path(item["image"])
+    if image_abs_path:
+        # print(item['image'])
+        # images\item_4_20251016_212755.jpeg
+
+        # /gradio_api/file= + allowed_paths 配合使用
+        # https://blog.gitcode.com/5eaed1170a48c79c5c3391f182927f5a.html
+        # https://gradio.org.cn/guides/file-access
+        image_tag = f'<img src="gradio_api/file={image_abs_path}" class="item-image" />'
+    else:
+        image_tag = _NO_IMAGE_TAG
+
+    # 用户输入的文本统一做 HTML 转义（防止 XSS）；卡片有缓存，每个物品只转义一次
+    return _CARD_TPL.format_map(
+        {
+            "image_tag": image_tag,
+            "category": html.escape(str(item.get("category", "未分类"))),
+            "id": item["id"],
+            "name": html.escape(str(item["name"])),
+            "description": html.escape(str(item.get("description", "无描述"))),
+            # 渲染动态属性（不同类别不同字段）
+            "attrs_html": _render_attributes_html(
+                item.get("category", ""), item.get("attributes")
+            ),
+            # 格式化联系方式（支持邮箱、QQ、电话等）
+            "contact_html": format_contact(item["contact"]),
+            "create_time": item["create_time"],
+        }
+    )
+
+
+def _get_item_card(item):
+    """返回物品卡片 HTML；物品字段未变化时命中 _card_cache"""
+    signature = (
+        item["id"],
+        item.get("image"),
+        item["name"],
+        item.get("description"),
+        item["contact"],
+        item["create_time"],
+        item.get("category"),
+        item.get("attributes"),
+    )
+    cached = _card_cache.get(item["id"])
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    card_html = _render_item_card(item)
+    _card_cache[item["id"]] = (signature, card_html)
+    return card_html
+
+
+# 物品列表 HTML 缓存：entry 为 (物品列表, {显示数量: html})（增删页显示全部、列表页分页，各缓存一份）
+# load_items() 在数据未变化时返回同一个列表对象，此时直接复用上次渲染的整页 HTML。
+# 列表对象变化时整体换成新的 entry（不原地清空），只保留最新一版；
+# 仍在渲染旧列表的线程写入时发现 entry 已换掉，就放弃写入，不会把旧 HTML 混进新列表的缓存
+_items_list_html = {"entry": (None, {})}
+
+
+def _invalidate_render_caches():
+    """类别配置变化（属性标签可能改变）后，清空卡片与列表的渲染缓存"""
+    _field_defs.clear()
+    _label_maps.clear()
+    _field_specs.clear()
+    _render_attributes_html.cache_clear()
+    _card_cache.clear()
+    _items_list_html["entry"] = (None, {})
+    _search_html["entry"] = (None, {})
+    _category_config_html["value"] = None
+
+
+def get_items_list(limit=None):
     """
     生成物品列表的 HTML 卡片视图
 
@@ -518,7 +796,9 @@ def get_items_list():
         将物品数据渲染为响应式卡片布局的 HTML
 
     输入参数:
-        无（从数据文件读取）
+        limit (int|None): 最多渲染的物品数量；None 表示按 ID 顺序显示全部（增删页）
+                          “物品列表”页传入整数：从最新的物品开始倒序显示，
+                          更早的物品通过“加载更多”追加
 
     返回值:
         str: HTML 格式的物品列表，包含:
@@ -533,72 +813,90 @@ def get_items_list():
 
     渲染逻辑:
         1. 加载所有物品数据
-        2. 为每个物品生成 HTML 卡片
+        2. 为每个物品生成 HTML 卡片（_get_item_card，内容未变的物品复用缓存）
         3. 处理图片显示（存在/不存在）
         4. 调用 format_contact() 格式化联系方式
-        5. 组装完整的 HTML 字符串
+        5. 收集卡片片段后用 "".join 组装完整的 HTML 字符串
 
     图片处理:
         使用 Gradio 的文件访问 API: /gradio_api/file={绝对路径}
         需配合 app.launch(allowed_paths=[...]) 使用
     """
+    _sync_category_config()
     items = load_items(DB_FILE)
 
+    # 分页数量不超过物品总数，缓存键的个数因此有上限
+    if limit is not None:
+        limit = min(limit, len(items))
+
+    # 数据未变化：直接返回上次的渲染结果
+    entry = _items_list_html["entry"]
+    if entry[0] is not items:
+        entry = (items, {})
+        _items_list_html["entry"] = entry
+    cached_html = entry[1].get(limit)
+    if cached_html is not None:
+        return cached_html
+
     # 处理空列表情况
     if not items:
-        return "<div style='text-align: center; padding: 50px; color: #999;'>暂无物品信息</div>"
-
-    # 开始构建 HTML
-    display_cards_html = '<div class="items-container">'
-
-    for item in items:
-        # 处理物品图片
-        image_tag = ""
-        if item.get("image") and os.path.exists(item["image"]):
-            # print(item['image'])
-            # images\item_4_20251016_212755.jpeg
-
-            image_path = item["image"].replace("\\", "/")
-            # 把字符串中的所有反斜杠 \ 替换成正斜杠 /
-            # 在 Python 字符串中，\ 是转义字符，需要用 \\ 表示一个真正的反斜杠
-            # print(image_path)
-            # images/item_4_20251016_212755.jpeg
-
-            # /gradio_api/file= + allowed_paths 配合使用
-            # https://blog.gitcode.com/5eaed1170a48c79c5c3391f182927f5a.html
-            # https://gradio.org.cn/guides/file-access
-            image_abs_path = os.path.abspath(item["image"]).replace("\\", "/")
-            image_tag = (
-                f'<img src="gradio_api/file={image_abs_path}" class="item-image" />'
+        display_cards_html = "<div style='text-align: center; padding: 50px; color: #999;'>暂无物品信息</div>"
+    else:
+        # load_items() 按 id 升序；分页时取最后 limit 个并倒序，新添加的物品排在最前
+        shown = items if limit is None else items[len(items) - limit :][::-1]
+        # 开始构建 HTML（先收集片段，最后一次性 join，避免循环中反复 += 拼接）
+        parts = ['<div class="items-container">']
+        for item in shown:
+            parts.append(_get_item_card(item))
+        parts.append("</div>")
+        if len(shown) < len(items):
+            parts.append(
+                "<div style='text-align: center; padding: 10px; color: #999;'>"
+                f"已显示 {len(shown)} / {len(items)} 个物品</div>"
             )
-        else:
-            # 无图片时显示占位符
-            image_tag = '<div class="item-image" style="background: #f5f5f5; display: flex; align-items: center; justify-content: center; color: #999;">暂无图片</div>'
+        display_cards_html = "".join(parts)
 
-        # 格式化联系方式（支持邮箱、QQ、电话等）
-        contact_html = format_contact(item["contact"])
+    # 渲染期间列表可能已被新数据替换：只写入仍属于这份列表的缓存
+    if _items_list_html["entry"] is entry:
+        entry[1][limit] = display_cards_html
+    return display_cards_html
 
-        # 渲染动态属性（不同类别不同字段）
-        attrs_html = _render_attributes_html(
-            item.get("category", ""), item.get("attributes")
-        )
 
-        # 构建单个物品卡片
-        display_cards_html += f"""
-        <div class="item-card">
-            {image_tag}
-            <div class="item-category">🏷️ {item.get('category', '未分类')}</div>
-            <div class="item-id">ID: {item['id']}</div>
-            <div class="item-name">{item['name']}</div>
-            <div class="item-desc">{item.get('description', '无描述')}</div>
-            {attrs_html}
-            {contact_html}
-            <div class="item-time">⏰ {item['create_time']}</div>
-        </div>
-        """
+def load_more_items(limit):
+    """“加载更多”：多显示一页物品，返回 (列表 HTML, 新的显示数量)"""
+    # 显示数量不超过物品总数（至少一页），全部显示后再点击不会继续增长
+    total = len(load_items(DB_FILE))
+    limit = min(
+        (limit or ITEMS_PAGE_SIZE) + ITEMS_PAGE_SIZE, max(total, ITEMS_PAGE_SIZE)
+    )
+    return get_items_list(limit), limit
 
-    display_cards_html += "</div>"
-    return display_cards_html
+
+# 搜索用的行数据：(物品列表, [(item, name_lc, desc_lc), ...])
+# load_items() 缓存命中时返回同一个列表对象，此时直接复用，不必每次搜索都逐个 .lower()
+_search_rows = {"entry": (None, [])}
+
+
+def _get_search_rows(items):
+    cached_items, rows = _search_rows["entry"]
+    if cached_items is not items:
+        rows = [
+            (
+                item,
+                (item["name"] or "").lower(),
+                (item.get("description") or "").lower(),
+            )
+            for item in items
+        ]
+        _search_rows["entry"] = (items, rows)
+    return rows
+
+
+# 搜索结果 HTML 缓存：entry 为 (物品列表, {(小写关键词, 分类集合): html})
+# 物品列表对象变化（数据有增删）时换成新的 entry（不原地清空），仍在搜索旧列表的线程不会写入新缓存；
+# 同一份列表上的结果条目过多时直接清空，避免无限增长
+_SEARCH_CACHE_SIZE = 256
+_search_html = {"entry": (None, {})}
 
 
 def search_items(keyword, category_filter):
@@ -621,8 +919,9 @@ def search_items(keyword, category_filter):
 
     搜索逻辑:
         1. 加载所有物品
-        2. 按分类筛选（支持单选和多选）
-        3. 按关键词过滤（名称或描述包含关键词）
+        2. 相同查询在数据未变化时直接返回缓存的结果 HTML
+        3. 一次遍历同时完成分类筛选（支持单选和多选）
+           与关键词过滤（名称或描述包含关键词）
         4. 生成结果 HTML
 
     特殊处理:
@@ -630,81 +929,85 @@ def search_items(keyword, category_filter):
         - 关键词为空时只按分类筛选
         - 未找到结果时返回提示信息
     """
-    items = load_items(DB_FILE)
+    _sync_category_config()
+    all_items = load_items(DB_FILE)
 
     # 默认值处理
     if not category_filter:
         category_filter = "全部"
 
-    # 分类筛选逻辑
+    # 分类筛选条件：None 表示不筛选，否则为允许的分类集合（集合判断 O(1)）
+    allowed = None
     if isinstance(category_filter, str):
         # 单个分类
         if category_filter != "全部":
-            items = [item for item in items if item.get("category") == category_filter]
+            allowed = {category_filter}
     elif isinstance(category_filter, list):
         # 多个分类
         if "全部" not in category_filter:
-            items = [item for item in items if item.get("category") in category_filter]
-
-    # 关键词搜索（不区分大小写）
-    if keyword:
-        items = [
-            item
-            for item in items
-            if keyword.lower() in item["name"].lower()
-            or keyword.lower() in item.get("description", "").lower()
-        ]
+            allowed = set(category_filter)
+
+    # 关键词（不区分大小写）只转一次小写；物品字段使用预先转好的小写
+    kw = keyword.lower() if keyword else None
+
+    # 同一批数据上重复的查询（相同关键词与分类）直接返回上次的结果
+    entry = _search_html["entry"]
+    if entry[0] is not all_items:
+        entry = (all_items, {})
+        _search_html["entry"] = entry
+    results = entry[1]
+    query_key = (kw, frozenset(allowed) if allowed is not None else None)
+    cached_html = results.get(query_key)
+    if cached_html is not None:
+        return cached_html, ""
+    if len(results) >= _SEARCH_CACHE_SIZE:
+        results.clear()
+
+    # 分类筛选与关键词搜索在同一次遍历中完成
+    items = [
+        item
+        for item, name_lc, desc_lc in _get_search_rows(all_items)
+        if (allowed is None or item.get("category") in allowed)
+        and (kw is None or kw in name_lc or kw in desc_lc)
+    ]
 
     # 未找到结果
     if not items:
-        return (
-            "<div style='text-align: center; padding: 50px; color: #999;'>未找到相关物品</div>",
-            "",
-        )
+        result_html = "<div style='text-align: center; padding: 50px; color: #999;'>未找到相关物品</div>"
+    else:
+        # 构建搜索结果 HTML（复用卡片样式与卡片缓存）
+        parts = [
+            f'<div class="search-header">找到 {len(items)} 个相关物品</div>',
+            '<div class="items-container">',
+        ]
+        for item in items:
+            parts.append(_get_item_card(item))
+        parts.append("</div>")
+        result_html = "".join(parts)
 
-    # 构建搜索结果 HTML（复用卡片样式）
-    search_cards_html = f'<div class="search-header">找到 {len(items)} 个相关物品</div>'
-    search_cards_html += '<div class="items-container">'
-
-    for item in items:
-        # 处理图片
-        image_tag = ""
-        if item.get("image") and os.path.exists(item["image"]):
-            image_abs_path = os.path.abspath(item["image"]).replace("\\", "/")
-            image_tag = (
-                f'<img src="gradio_api/file={image_abs_path}" class="item-image" />'
-            )
-        else:
-            image_tag = '<div class="item-image" style="background: #f5f5f5; display: flex; align-items: center; justify-content: center; color: #999;">暂无图片</div>'
+    # 搜索期间数据可能已变化：只写入仍属于这份物品列表的缓存
+    if _search_html["entry"] is entry:
+        results[query_key] = result_html
+    return result_html, ""
 
-        # 格式化联系方式
-        contact_html = format_contact(item["contact"])
 
-        attrs_html = _render_attributes_html(
-            item.get("category", ""), item.get("attributes")
-        )
+# ==================== 管理员：物品类型管理 ====================
 
-        search_cards_html += f"""
-        <div class="item-card">
-            {image_tag}
-            <div class="item-category">🏷️ {item.get('category', '未分类')}</div>
-            <div class="item-id">ID: {item['id']}</div>
-            <div class="item-name">{item['name']}</div>
-            <div class="item-desc">{item.get('description', '无描述')}</div>
-            {attrs_html}
-            {contact_html}
-            <div class="item-time">⏰ {item['create_time']}</div>
-        </div>
-        """
 
-    search_cards_html += "</div>"
-    return search_cards_html, ""
+# 类别配置表格 HTML；类别配置变化（包括手动编辑配置文件）时随渲染缓存一起清空
+_category_config_html = {"value": None}
 
 
-# ==================== 管理员：物品类型管理 ====================
+def _render_category_config_html() -> str:
+    _sync_category_config()
+    html_text = _category_config_html["value"]
+    if html_text is None:
+        html_text = _build_category_config_html()
+        _category_config_html["value"] = html_text
+    return html_text
 
 
-def _render_category_config_html() -> str:
+def _build_category_config_html() -> str:
     categories = category_config.get_categories()
     fields_map = category_config.get_category_fields()
 
@@ -734,8 +1037,9 @@ def _render_category_config_html() -> str:
     )
 
 
-def _dropdown_updates_after_category_change():
-    cats = category_config.get_categories()
+def _dropdown_updates_after_category_change(cats=None):
+    if cats is None:
+        cats = category_config.get_categories()
     return (
         gr.update(choices=cats),
         gr.update(choices=["全部"] + cats),
@@ -790,10 +1094,13 @@ def admin_category_save(
         fields_json=fields_json,
     )
     prefix = "✅ " if ok else "❌ "
+    if ok:
+        # 属性标签可能变化，已缓存的物品卡片需要重新渲染
+        _invalidate_render_caches()
 
     cats = category_config.get_categories()
     cat_select_upd = gr.update(choices=cats, value=None)
-    add_upd, search_upd = _dropdown_updates_after_category_change()
+    add_upd, search_upd = _dropdown_updates_after_category_change(cats)
 
     return (
         prefix + msg,
@@ -832,8 +1139,7 @@ def admin_category_delete(selected_category: str, request: gr.Request | None):
             search_upd,
         )
 
-    _ensure_db_schema(DB_FILE)
-    with _get_db_connection(DB_FILE) as conn:
+    with _get_read_connection(DB_FILE) as conn:
         cnt = conn.execute(
             "SELECT COUNT(1) AS c FROM items WHERE category = ?",
             (selected_category,),
@@ -853,9 +1159,11 @@ def admin_category_delete(selected_category: str, request: gr.Request | None):
 
     ok, msg = category_config.delete_category(selected_category)
     prefix = "✅ " if ok else "❌ "
+    if ok:
+        _invalidate_render_caches()
     cats = category_config.get_categories()
     cat_select_upd = gr.update(choices=cats, value=None)
-    add_upd, search_upd = _dropdown_updates_after_category_change()
+    add_upd, search_upd = _dropdown_updates_after_category_change(cats)
 
     return (
         prefix + msg,
@@ -871,7 +1179,10 @@ def admin_category_delete(selected_category: str, request: gr.Request | None):
 # ==================== Gradio 界面构建 ====================
 
 # 创建 Gradio 应用界面
-with gr.Blocks(title="物品复活平台 - 首页", css=custom_css) as main_ui:
+# 构建界面时的类别列表只读取一次，供各个下拉框共用
+_CATEGORIES = category_config.get_categories()
+
+with gr.Blocks(title="物品复活平台 - 首页", css=_load_css()) as main_ui:
     # 页面标题
     gr.Markdown(value="# 🔄 物品复活平台")
     gr.Markdown(value="## 让闲置物品找到新主人！")
@@ -891,20 +1202,25 @@ with gr.Blocks(title="物品复活平台 - 首页", css=custom_css) as main_ui:
     # 页面加载时显示欢迎信息
     main_ui.load(show_welcome, None, welcome_msg)
 
+    # 增删两个页签的列表初始值相同，构建界面时只生成一次
+    initial_items_html = get_items_list()
+
     # ========== Tab 1: 添加物品 ==========
     with gr.Tab(label="📝 添加物品"):
         with gr.Row():
             # 左侧：输入表单
             with gr.Column():
                 add_name = gr.Textbox(label="物品名称*", placeholder="例如：二手自行车")
-                _cats = category_config.get_categories()
                 _default_cat = (
-                    "书籍" if "书籍" in _cats else (_cats[0] if _cats else None)
+                    "书籍"
+                    if "书籍" in _CATEGORIES
+                    else (_CATEGORIES[0] if _CATEGORIES else None)
                 )
                 add_category = gr.Dropdown(
-                    choices=_cats,
+                    choices=_CATEGORIES,
                     value=_default_cat,
                     multiselect=False,
+                    filterable=True,
                     label="物品分类*",
                 )
 
@@ -935,7 +1251,7 @@ with gr.Blocks(title="物品复活平台 - 首页", css=custom_css) as main_ui:
             with gr.Column():
                 add_output = gr.Textbox(label="操作结果", lines=2)
                 gr.Markdown(value="**当前物品列表**")
-                add_list = gr.HTML(value=get_items_list())
+                add_list = gr.HTML(value=initial_items_html)
 
         # 绑定添加按钮事件
         add_btn.click(
@@ -980,7 +1296,7 @@ with gr.Blocks(title="物品复活平台 - 首页", css=custom_css) as main_ui:
             # 右侧：操作结果和列表
             with gr.Column():
                 del_output = gr.Textbox(label="操作结果", lines=2)
-                del_list = gr.HTML(label="当前物品列表", value=get_items_list())
+                del_list = gr.HTML(label="当前物品列表", value=initial_items_html)
 
         # 绑定删除按钮事件
         del_btn.click(
@@ -989,11 +1305,18 @@ with gr.Blocks(title="物品复活平台 - 首页", css=custom_css) as main_ui:
 
     # ========== Tab 3: 物品列表 ==========
     with gr.Tab(label="📋 物品列表"):
-        list_output = gr.HTML(value=get_items_list())
-        refresh_btn = gr.Button("🔄 刷新列表")
+        # 分页显示：当前显示数量保存在会话状态中
+        list_limit = gr.State(ITEMS_PAGE_SIZE)
+        list_output = gr.HTML(value=get_items_list(ITEMS_PAGE_SIZE))
+        with gr.Row():
+            refresh_btn = gr.Button("🔄 刷新列表")
+            more_btn = gr.Button("⬇️ 加载更多")
 
-        # 绑定刷新按钮事件
-        refresh_btn.click(lambda: get_items_list(), outputs=[list_output])
+        # 绑定刷新按钮事件（保持当前已加载的数量）
+        refresh_btn.click(get_items_list, inputs=[list_limit], outputs=[list_output])
+        more_btn.click(
+            load_more_items, inputs=[list_limit], outputs=[list_output, list_limit]
+        )
 
     # ========== Tab 4: 查找物品 ==========
     with gr.Tab(label="🔍 查找物品"):
@@ -1004,9 +1327,10 @@ with gr.Blocks(title="物品复活平台 - 首页", css=custom_css) as main_ui:
                     label="搜索关键词", placeholder="输入物品名称或描述"
                 )
                 search_category = gr.Dropdown(
-                    choices=["全部"] + category_config.get_categories(),
+                    choices=["全部"] + _CATEGORIES,
                     value="全部",
                     multiselect=True,
+                    filterable=True,
                     label="筛选分类",
                 )
                 search_btn = gr.Button(value="搜索", variant="primary")
@@ -1052,8 +1376,9 @@ with gr.Blocks(title="物品复活平台 - 首页", css=custom_css) as main_ui:
         with gr.Row():
             with gr.Column(scale=1):
                 cat_select = gr.Dropdown(
-                    choices=category_config.get_categories(),
+                    choices=_CATEGORIES,
                     value=None,
+                    filterable=True,
                     label="选择要编辑的类型",
                 )
                 cat_name = gr.Textbox(
@@ -1123,7 +1448,7 @@ with gr.Blocks(title="物品复活平台 - 首页", css=custom_css) as main_ui:
     )
 
 # 注册页面（无需登录），与主应用同进程同端口，通过 FastAPI 挂载在 /register
-with gr.Blocks(title="物品复活平台 - 用户注册", css=custom_css) as register_page:
+with gr.Blocks(title="物品复活平台 - 用户注册", css=_load_css()) as register_page:
     gr.Markdown(value="# 📝 新用户注册")
     gr.Markdown(
         value="注册后默认进入待审批 (pending) 状态，管理员批准后才能登录主应用。"
@@ -1176,6 +1501,14 @@ if __name__ == "__main__":
         公网: 需设置 share=True
     """
     try:
+        # 放宽事件队列并发：默认每个事件同时只处理一个请求，多个用户会互相阻塞
+        register_page.queue(
+            max_size=QUEUE_MAX_SIZE, default_concurrency_limit=QUEUE_CONCURRENCY_LIMIT
+        )
+        main_ui.queue(
+            max_size=QUEUE_MAX_SIZE, default_concurrency_limit=QUEUE_CONCURRENCY_LIMIT
+        )
+
         # 挂载注册页（无需登录）
         gr.mount_gradio_app(
             app,
@@ -1199,7 +1532,8 @@ if __name__ == "__main__":
             allowed_paths=[IMAGE_DIR],
         )
 
-        uvicorn.run(app, host="127.0.0.1", port=7861)
+        # loop/http 为 "auto"：安装了 uvloop、httptools 时自动使用（Windows 上没有 uvloop，回退 asyncio）
+        uvicorn.run(app, host="127.0.0.1", port=7861, loop="auto", http="auto")
     except Exception:
         traceback.print_exc()
         input("程序发生严重错误，请截图发给开发者。按回车键退出...")
@@ -9,6 +9,8 @@
     配合 app.load() 实现页面加载时的个性化欢迎
 """
 
+from functools import lru_cache
+
 import gradio as gr
 
 
@@ -43,4 +45,10 @@ def show_welcome(request: gr.Request):
     username = request.username if hasattr(request, "username") else "游客"
 
     # 返回 Markdown 格式的欢迎消息
+    return _welcome_text(username)
+
+
+@lru_cache(maxsize=128)
+def _welcome_text(username):
+    """按用户名缓存欢迎消息，页面刷新时直接复用"""
     return f"### 👋 欢迎回来，{username}！"
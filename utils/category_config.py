@@ -1,4 +1,4 @@
-import json
+import orjson
 import os
 from typing import Any
 
@@ -11,6 +11,10 @@ from constants import MAX_DYNAMIC_FIELDS
 
 CONFIG_FILE_NAME = "category_config.json"
 
+# load_config() 的结果缓存：按配置文件的 (mtime_ns, size) 判断是否变化，
+# 文件未变时直接返回上次解析、校验后的结果（调用方只读，不要原地修改）
+_config_cache: dict[str, Any] = {"key": None, "value": None}
+
 
 def _config_path() -> str:
     return get_path_for_write(CONFIG_FILE_NAME)
@@ -65,14 +69,14 @@ def _validate_config(categories: Any, category_fields: Any) -> tuple[bool, str]:
 
 
 def _read_json(path: str) -> Any:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
 
 
 def _atomic_write_json(path: str, payload: Any) -> None:
     tmp = path + ".tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(payload, f, ensure_ascii=False, indent=2)
+    with open(tmp, "wb") as f:
+        f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
     os.replace(tmp, path)
 
 
@@ -85,24 +89,40 @@ def load_config() -> dict[str, Any]:
     """
     path = _config_path()
 
-    if os.path.exists(path):
+    # 文件不存在时键为 None（使用默认值，同样可以缓存）
+    try:
+        st = os.stat(path)
+        key = (path, st.st_mtime_ns, st.st_size)
+    except OSError:
+        key = (path, None)
+    if _config_cache["key"] == key:
+        return _config_cache["value"]
+
+    config = None
+    if key[1] is not None:
         try:
             data = _read_json(path)
             categories = data.get("categories")
             category_fields = data.get("category_fields")
             ok, _ = _validate_config(categories, category_fields)
             if ok:
-                return {"categories": categories, "category_fields": category_fields}
+                config = {"categories": categories, "category_fields": category_fields}
         except Exception:
             # 配置文件损坏/格式不对：回退默认
             pass
 
-    return {
-        "categories": list(DEFAULT_CATEGORIES),
-        "category_fields": json.loads(
-            json.dumps(DEFAULT_CATEGORY_FIELDS, ensure_ascii=False)
-        ),
-    }
+    if config is None:
+        config = {
+            "categories": list(DEFAULT_CATEGORIES),
+            # 字段定义都是扁平的小字典，逐层浅拷贝即可得到可修改的副本
+            "category_fields": {
+                k: [dict(f) for f in v] for k, v in DEFAULT_CATEGORY_FIELDS.items()
+            },
+        }
+
+    _config_cache["key"] = key
+    _config_cache["value"] = config
+    return config
 
 
 def save_config(
@@ -124,6 +144,8 @@ def save_config(
 
     payload = {"categories": categories, "category_fields": category_fields}
     _atomic_write_json(_config_path(), payload)
+    # mtime 精度不足时可能判断不出变化，写入后主动让缓存失效
+    _config_cache["key"] = None
     return True, "已保存类别配置"
 
 
@@ -172,7 +194,7 @@ def get_category_fields() -> dict[str, list[dict[str, Any]]]:
 def get_fields_json_for_category(category: str) -> str:
     category = (category or "").strip()
     fields = get_category_fields().get(category, [])
-    return json.dumps(fields, ensure_ascii=False, indent=2)
+    return orjson.dumps(fields, option=orjson.OPT_INDENT_2).decode()
 
 
 def upsert_category(
@@ -190,7 +212,7 @@ def upsert_category(
         return False, "类型名称过长（建议 ≤ 20 字符）"
 
     try:
-        fields_raw = json.loads(fields_json or "[]")
+        fields_raw = orjson.loads(fields_json or "[]")
     except Exception:
         return False, "属性定义 JSON 解析失败"
 
@@ -9,7 +9,9 @@
     支持协议: mailto:, tel:, tencent://
 """
 
+import html
 import re
+from functools import lru_cache
 
 # ==================== 全局常量 ====================
 # 邮箱正则表达式模式
@@ -21,10 +23,16 @@ PHONE_PATTERN = r"^1[3-9]\d{9}$"
 # QQ号正则表达式模式（5-11位数字）
 QQ_PATTERN = r"^\d{5,11}$"
 
+# 模块加载时预编译，format_contact 中直接调用 .match()
+EMAIL_RE = re.compile(EMAIL_PATTERN)
+PHONE_RE = re.compile(PHONE_PATTERN)
+QQ_RE = re.compile(QQ_PATTERN)
+
 
 # ==================== 主要功能函数 ====================
 
 
+@lru_cache(maxsize=4096)
 def format_contact(contact):
     """
     识别联系方式类型并返回格式化的 HTML
@@ -49,6 +57,10 @@ def format_contact(contact):
         3. QQ号: 5-11位纯数字
         4. 其他: 作为普通文本显示（如微信号）
 
+    缓存说明:
+        纯函数（同一输入必得同一输出），用 lru_cache 缓存结果；
+        同一卖家的多件物品共用联系方式，渲染时直接命中缓存
+
     协议说明:
         - mailto: 邮件协议，打开默认邮件客户端
         - tel: 电话协议，移动端拨打电话
@@ -71,8 +83,7 @@ def format_contact(contact):
     # 判断是否为邮箱
     # 协议: mailto:
     # 原理: 当一个 <a> 标签的 href 属性以 mailto: 开头时，浏览器会调用操作系统默认的邮件客户端（如 Windows 的邮件、Outlook 或 Foxmail），并自动将 mailto: 后面的地址填入收件人。
-    email_pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    if re.match(email_pattern, contact):
+    if EMAIL_RE.match(contact):
         return f"""
         <div class="contact-info">
             <a href="mailto:{contact}" class="contact-link email" title="发送邮件">
@@ -85,8 +96,7 @@ def format_contact(contact):
     # 判断是否为手机号（11位数字）
     # 协议: tel:
     # 原理: tel: 协议主要用于移动设备。在手机上点击一个 tel: 链接，会直接跳转到拨号界面，并将号码预填写好。在桌面上，行为则不统一，可能会提示用 Skype 或其他网络电话应用打开。
-    phone_pattern = r"^1[3-9]\d{9}$"
-    if re.match(phone_pattern, contact):
+    if PHONE_RE.match(contact):
         return f"""
         <div class="contact-info">
             <a href="tel:{contact}" class="contact-link phone" title="拨打电话">
@@ -100,8 +110,7 @@ def format_contact(contact):
     # 原理: 如果用户的电脑上安装了 QQ，点击这个链接就会唤起 QQ 客户端，并打开与指定 QQ 号码的临时聊天窗口。如果没安装，则无反应。
     # HTML 示例: <a href="tencent://message/?uin=123456789&Site=item_revival&Menu=yes">点击与 QQ:123456789 聊天</a>
     # uin 后面跟的是 QQ 号。Site 和 Menu 是附加参数，可以保留。
-    qq_pattern = r"^\d{5,11}$"
-    if re.match(qq_pattern, contact):
+    if QQ_RE.match(contact):
         return f"""
         <div class="contact-info">
             <a href="tencent://message/?uin={contact}&Site=&Menu=yes" class="contact-link qq" title="通过QQ联系">
@@ -112,10 +121,11 @@ def format_contact(contact):
         """
 
     # ========== 其他情况（微信号等） ==========
+    # 任意文本：做 HTML 转义后再嵌入（上面三种格式只含安全字符）
     return f"""
     <div class="contact-info">
         <span class="contact-text">
-            📱 {contact}
+            📱 {html.escape(contact)}
         </span>
     </div>
     """
@@ -1,30 +1,123 @@
+import hashlib
+import hmac
+import os
+import queue
+import secrets
 import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
 
+from utils.util import get_path_for_write
 
-def row_to_dict(row: sqlite3.Row | None) -> dict | None:
-    if row is None:
+# ==================== 查询结果缓存 ====================
+# 每次 Gradio 回调都会调用 load_items()/load_users()，而数据在两次请求之间很少变化。
+# 这里按数据库文件的 (st_mtime_ns, st_size) 缓存查询结果：文件未变则直接返回上次的结果。
+# 注意：返回的是共享对象，调用方只读、不要原地修改。
+_items_cache = {"key": None, "value": None}
+_users_cache = {"key": None, "value": None}
+_auth_cache = {"key": None, "value": None}
+_pending_cache = {"key": None, "value": None}
+
+
+def _db_file_key(DB_FILE) -> tuple | None:
+    """以 (路径, mtime_ns, size) 作为缓存键；文件不存在时返回 None（不缓存）。
+
+    WAL 模式下提交先写入 "-wal" 文件，因此把它的状态也计入缓存键。
+    """
+    try:
+        st = os.stat(DB_FILE)
+    except OSError:
         return None
-    return {k: row[k] for k in row.keys()}
+    try:
+        wal = os.stat(DB_FILE + "-wal")
+        wal_key = (wal.st_mtime_ns, wal.st_size)
+    except OSError:
+        wal_key = None
+    return (DB_FILE, st.st_mtime_ns, st.st_size, wal_key)
+
+
+def _invalidate_items_cache() -> None:
+    """写入 items 表后调用，避免 mtime 精度不足时读到旧数据。"""
+    _items_cache["key"] = None
+
+
+def _invalidate_users_cache() -> None:
+    """写入 users 表后调用。"""
+    _users_cache["key"] = None
+    _auth_cache["key"] = None
+    _pending_cache["key"] = None
+
 
+# ==================== 密码摘要 ====================
+# 密码不再明文存储，而是保存带密钥的 BLAKE2b 摘要："b2$" + 128 位十六进制。
+# 密钥优先取环境变量 CS3331_PASSWORD_KEY（最多 64 字节）；未设置时使用可写目录下的
+# password.key，首次运行时随机生成。密钥文件丢失或修改密钥后，已有账号将无法登录。
+PASSWORD_KEY_FILE_NAME = "password.key"
+_PASSWORD_PREFIX = "b2$"
 
-def _column_exists(conn: sqlite3.Connection, table: str, column: str) -> bool:
-    """ """
-    rows = conn.execute(f"PRAGMA table_info({table})").fetchall()
-    return any(r[1] == column for r in rows)
 
+@lru_cache(maxsize=1)
+def _password_key() -> bytes:
+    env_key = os.environ.get("CS3331_PASSWORD_KEY")
+    if env_key:
+        return env_key.encode()[:64]
 
-def _ensure_column(
-    conn: sqlite3.Connection, table: str, column: str, column_def_sql: str
+    path = get_path_for_write(PASSWORD_KEY_FILE_NAME)
+    try:
+        # 首次运行：O_EXCL 保证多个进程同时启动时只有一个能创建密钥文件
+        # （不依赖硬链接，U 盘的 FAT32/exFAT 等文件系统上也能用）
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        return _read_password_key(path)
+    key = secrets.token_bytes(32)
+    with os.fdopen(fd, "w", encoding="ascii") as f:
+        f.write(key.hex())
+    return key
+
+
+def _read_password_key(path: str) -> bytes:
+    """读取已有的密钥文件；其他进程刚创建、还没写完时稍等重试"""
+    for _ in range(50):
+        with open(path, "r", encoding="ascii") as f:
+            text = f.read().strip()
+        if len(text) == 64:
+            return bytes.fromhex(text)
+        time.sleep(0.1)
+    raise RuntimeError(f"密码密钥文件内容无效：{path}")
+
+
+def hash_password(password: str) -> str:
+    """计算密码摘要（用于写入 users.password 以及登录时比对）"""
+    digest = hashlib.blake2b(password.encode(), key=_password_key()).hexdigest()
+    return _PASSWORD_PREFIX + digest
+
+
+def row_to_dict(row: sqlite3.Row | None) -> dict | None:
+    if row is None:
+        return None
+    # 按位置与列名配对，避免逐列按名字查找
+    return dict(zip(row.keys(), row))
+
+
+def _ensure_columns(
+    conn: sqlite3.Connection, table: str, columns: list[tuple[str, str]]
 ) -> None:
-    if _column_exists(conn, table, column):
-        return
-    conn.execute(f"ALTER TABLE {table} ADD COLUMN {column_def_sql}")
+    """补齐表中缺少的列；columns 为 [(列名, 列定义 SQL), ...]。
+
+    每张表只执行一次 PRAGMA table_info，再在本地集合里判断列是否存在。
+    """
+    existing = {r[1] for r in conn.execute(f"PRAGMA table_info({table})")}
+    for column, column_def_sql in columns:
+        if column not in existing:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {column_def_sql}")
 
 
-def _get_db_connection(DB_FILE) -> sqlite3.Connection:
+def _open_connection(DB_FILE) -> sqlite3.Connection:
     """创建 SQLite 连接，并启用 Row 工厂便于按列名取值。"""
-    # 1. 建立连接
-    conn = sqlite3.connect(DB_FILE)
+    # 1. 建立连接（连接会被 Gradio 线程池中的多个线程共享，访问由 _db_lock 串行化）
+    conn = sqlite3.connect(DB_FILE, check_same_thread=False)
     # 2. 关键一步：设置 row_factory
     # 这允许我们通过列名访问数据，并使用 row.keys()
     conn.row_factory = sqlite3.Row
@@ -32,14 +125,91 @@ def _get_db_connection(DB_FILE) -> sqlite3.Connection:
     默认情况：SQLite 返回的数据是元组 (1, "Alice")。你必须记住 1 是 ID，"Alice" 是用户名。
     开启后：SQLite 返回的是 Row 对象。它更像一个字典，你可以通过 row["username"] 来取值。这也是为什么你后续能使用 row_to_dict 函数的前提。
     """
+    # 3. WAL 模式：写操作只追加日志，读不阻塞写；配合 synchronous=NORMAL 避免每次提交都完整 fsync
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    # 4. 读多写少：用内存映射读取数据库页（省去一次内核到用户态的拷贝），并加大页缓存；
+    #    临时表/排序用内存。这些都是连接级设置，长连接上只需设置一次
+    conn.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+    conn.execute("PRAGMA cache_size=-65536")  # 64 MiB（负数表示 KiB）
+    conn.execute("PRAGMA temp_store=MEMORY")
     return conn
 
 
+# 每个数据库文件只保留一个写连接（长连接，加锁串行使用），避免每次请求都重新 connect；
+# 同一连接上的语句缓存（prepared statement）也能在请求之间复用。
+_connections: dict[str, sqlite3.Connection] = {}
+_db_lock = threading.RLock()
+
+# 只读查询使用单独的读连接池：WAL 模式下读不阻塞写，多个 Gradio 线程可以并行读取，
+# 也不必等待写锁。池中最多保留 READER_POOL_SIZE 个空闲连接，多出来的用完即关闭。
+READER_POOL_SIZE = os.cpu_count() or 4
+_reader_pools: dict[str, queue.LifoQueue] = {}
+_reader_pools_lock = threading.Lock()
+
+
+@contextmanager
+def _get_db_connection(DB_FILE):
+    """获取共享的写连接（加锁），并在退出 with 块时提交事务（异常时回滚）。
+
+    写事务以 BEGIN IMMEDIATE 开始，一开始就拿到写锁，避免与其他进程并发写时中途 SQLITE_BUSY。
+
+    用法保持不变：
+        with _get_db_connection(DB_FILE) as conn:
+            conn.execute(...)
+    """
+    with _db_lock:
+        conn = _connections.get(DB_FILE)
+        if conn is None:
+            conn = _open_connection(DB_FILE)
+            conn.isolation_level = "IMMEDIATE"
+            _connections[DB_FILE] = conn
+        with conn:
+            yield conn
+
+
+@contextmanager
+def _get_read_connection(DB_FILE):
+    """从读连接池借出一个连接（只用于 SELECT），用完归还。
+
+    用法：
+        with _get_read_connection(DB_FILE) as conn:
+            rows = conn.execute("SELECT ...").fetchall()
+    """
+    with _reader_pools_lock:
+        pool = _reader_pools.get(DB_FILE)
+        if pool is None:
+            pool = _reader_pools[DB_FILE] = queue.LifoQueue(maxsize=READER_POOL_SIZE)
+    try:
+        conn = pool.get_nowait()
+    except queue.Empty:
+        conn = _open_connection(DB_FILE)
+    try:
+        yield conn
+    finally:
+        try:
+            pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+
+# 已确认过表结构的数据库文件；表结构在运行期间不会变化，每个文件只检查一次
+_schema_ready: set[str] = set()
+
+
 def _ensure_db_schema(DB_FILE) -> None:
-    """确保数据库表存在；即便没运行 init_db.py 也能启动应用。"""
+    """确保数据库表存在；即便没运行 init_db.py 也能启动应用。
+
+    每个数据库文件只在进程内第一次调用时真正执行建表/补列，之后直接返回。
+    """
+    if DB_FILE in _schema_ready:
+        return
     with _get_db_connection(DB_FILE) as conn:
-        conn.execute(
+        # 建表、补列、建索引放在同一个写事务里，只提交一次
+        # （脚本以 BEGIN 开头且不带 COMMIT，事务由 with 块结束时统一提交）
+        conn.executescript(
             """
+            BEGIN IMMEDIATE;
             CREATE TABLE IF NOT EXISTS users (
                 id INTEGER PRIMARY KEY,
                 username TEXT UNIQUE NOT NULL,
@@ -48,11 +218,7 @@ def _ensure_db_schema(DB_FILE) -> None:
                 status TEXT DEFAULT 'pending',
                 contact TEXT NOT NULL,
                 address TEXT NOT NULL
-            )
-            """
-        )
-        conn.execute(
-            """
+            );
             CREATE TABLE IF NOT EXISTS items (
                 id INTEGER PRIMARY KEY,
                 name TEXT NOT NULL,
@@ -63,19 +229,51 @@ def _ensure_db_schema(DB_FILE) -> None:
                 create_time TEXT,
                 address TEXT,
                 attributes TEXT
-            )
+            );
             """
         )
 
         # 兼容旧数据库：users 表
-        _ensure_column(conn, "users", "role", "role TEXT DEFAULT 'user'")
-        _ensure_column(conn, "users", "status", "status TEXT DEFAULT 'pending'")
-        _ensure_column(conn, "users", "contact", "contact TEXT NOT NULL")
-        _ensure_column(conn, "users", "address", "address TEXT NOT NULL")
+        _ensure_columns(
+            conn,
+            "users",
+            [
+                ("role", "role TEXT DEFAULT 'user'"),
+                ("status", "status TEXT DEFAULT 'pending'"),
+                ("contact", "contact TEXT NOT NULL"),
+                ("address", "address TEXT NOT NULL"),
+            ],
+        )
 
         # 兼容旧数据库：items 表
-        _ensure_column(conn, "items", "address", "address TEXT")
-        _ensure_column(conn, "items", "attributes", "attributes TEXT")
+        _ensure_columns(
+            conn,
+            "items",
+            [
+                ("address", "address TEXT"),
+                ("attributes", "attributes TEXT"),
+            ],
+        )
+
+        # 兼容旧数据库：把仍为明文的密码原地替换为摘要。
+        # 只有“前缀 b2$（区分大小写）且总长 131”的值才视为摘要；LIKE 不区分大小写，不能用
+        plain_rows = conn.execute(
+            "SELECT id, password FROM users"
+            " WHERE substr(password, 1, 3) <> ? OR length(password) <> ?",
+            (_PASSWORD_PREFIX, len(_PASSWORD_PREFIX) + 128),
+        ).fetchall()
+        if plain_rows:
+            conn.executemany(
+                "UPDATE users SET password = ? WHERE id = ?",
+                [(hash_password(pw or ""), user_id) for user_id, pw in plain_rows],
+            )
+
+        # 索引：待审批列表按 (status, id) 走范围扫描；删除类型前按 category 统计物品数量
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_users_status_id ON users(status, id)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_items_category ON items(category)")
+    _schema_ready.add(DB_FILE)
 
 
 # ==================== 用户管理功能模块 ====================
@@ -83,17 +281,25 @@ def _ensure_db_schema(DB_FILE) -> None:
 
 def load_users(DB_FILE):
     """
-    加载用户密码映射
+    加载用户密码映射（带缓存，数据库文件未变化时直接返回上次结果）
     """
     _ensure_db_schema(DB_FILE)
-    with _get_db_connection(DB_FILE) as conn:
+    key = _db_file_key(DB_FILE)
+    if key is not None and key == _users_cache["key"]:
+        return _users_cache["value"]
+
+    with _get_read_connection(DB_FILE) as conn:
         rows = conn.execute("SELECT username, password FROM users").fetchall()
-        return {row["username"]: row["password"] for row in rows}
+    users = {row["username"]: row["password"] for row in rows}
+
+    _users_cache["key"] = key
+    _users_cache["value"] = users
+    return users
 
 
 def get_user_by_username(username: str, DB_FILE) -> dict | None:
     _ensure_db_schema(DB_FILE)
-    with _get_db_connection(DB_FILE) as conn:
+    with _get_read_connection(DB_FILE) as conn:
         row = conn.execute(
             """
             SELECT id, username, password, role, status, contact, address
@@ -105,16 +311,37 @@ def get_user_by_username(username: str, DB_FILE) -> dict | None:
     return row_to_dict(row)
 
 
+def _load_auth_table(DB_FILE) -> dict:
+    """用户名 -> (密码摘要, 状态) 的映射（带缓存，数据库文件未变化时直接返回上次结果）"""
+    _ensure_db_schema(DB_FILE)
+    key = _db_file_key(DB_FILE)
+    if key is not None and key == _auth_cache["key"]:
+        return _auth_cache["value"]
+
+    with _get_read_connection(DB_FILE) as conn:
+        rows = conn.execute("SELECT username, password, status FROM users").fetchall()
+    table = {row["username"]: (row["password"], row["status"]) for row in rows}
+
+    _auth_cache["key"] = key
+    _auth_cache["value"] = table
+    return table
+
+
 def authenticate_user(
     username: str, password: str, DB_FILE, require_approved: bool = True
 ) -> bool:
-    """校验用户名和密码；可选要求 status=approved 才允许登录。"""
-    user = get_user_by_username(username, DB_FILE)
-    if not user:
+    """校验用户名和密码；可选要求 status=approved 才允许登录。
+
+    每次登录（以及 Gradio 的认证检查）只做一次字典查找，不再逐次查询数据库；
+    密码按摘要做常量时间比较。
+    """
+    entry = _load_auth_table(DB_FILE).get(username)
+    if entry is None:
         return False
-    if require_approved and user.get("status") != "approved":
+    stored_hash, status = entry
+    if require_approved and status != "approved":
         return False
-    return user.get("password") == password
+    return hmac.compare_digest(stored_hash or "", hash_password(password or ""))
 
 
 def register_user(
@@ -145,17 +372,30 @@ def register_user(
                 INSERT INTO users (username, password, role, status, contact, address)
                 VALUES (?, ?, 'user', 'pending', ?, ?)
                 """,
-                (username, password, contact, address),
+                (username, hash_password(password), contact, address),
             )
+        _invalidate_users_cache()
         return True, "注册成功，等待管理员审批"
     except sqlite3.IntegrityError:
         return False, "用户名已存在"
 
 
+# list_pending_users 的 SELECT 列顺序
+_PENDING_USER_COLUMNS = ("id", "username", "role", "status", "contact", "address")
+
+
 def list_pending_users(DB_FILE) -> list[dict]:
+    """待审批用户列表（带缓存，数据库文件未变化时返回同一个列表对象）"""
     _ensure_db_schema(DB_FILE)
-    with _get_db_connection(DB_FILE) as conn:
-        rows = conn.execute(
+    key = _db_file_key(DB_FILE)
+    if key is not None and key == _pending_cache["key"]:
+        return _pending_cache["value"]
+
+    with _get_read_connection(DB_FILE) as conn:
+        # 与 load_items 相同：固定列顺序，用普通元组按位置转换
+        cur = conn.cursor()
+        cur.row_factory = None
+        rows = cur.execute(
             """
             SELECT id, username, role, status, contact, address
             FROM users
@@ -163,7 +403,11 @@ def list_pending_users(DB_FILE) -> list[dict]:
             ORDER BY id ASC
             """
         ).fetchall()
-    return [row_to_dict(r) for r in rows]
+    pending = [dict(zip(_PENDING_USER_COLUMNS, row)) for row in rows]
+
+    _pending_cache["key"] = key
+    _pending_cache["value"] = pending
+    return pending
 
 
 def approve_user(target_username: str, DB_FILE) -> tuple[bool, str]:
@@ -173,19 +417,20 @@ def approve_user(target_username: str, DB_FILE) -> tuple[bool, str]:
         return False, "请输入要批准的用户名"
 
     with _get_db_connection(DB_FILE) as conn:
-        row = conn.execute(
-            "SELECT status FROM users WHERE username = ?",
+        # 常见情况（待审批用户）一条 UPDATE 即可完成；没有更新到行时再区分原因
+        updated = conn.execute(
+            "UPDATE users SET status = 'approved' WHERE username = ? AND status IS NOT 'approved'",
             (target_username,),
-        ).fetchone()
-        if not row:
-            return False, "用户不存在"
-        if row["status"] == "approved":
+        ).rowcount
+        if not updated:
+            row = conn.execute(
+                "SELECT status FROM users WHERE username = ?",
+                (target_username,),
+            ).fetchone()
+            if not row:
+                return False, "用户不存在"
             return True, "该用户已是 approved 状态"
-
-        conn.execute(
-            "UPDATE users SET status = 'approved' WHERE username = ?",
-            (target_username,),
-        )
+    _invalidate_users_cache()
     return True, "已批准该用户"
 
 
@@ -220,8 +465,9 @@ def add_user(
                 INSERT INTO users (username, password, role, status, contact, address)
                 VALUES (?, ?, ?, ?, ?, ?)
                 """,
-                (username, password, role, status, contact, address),
+                (username, hash_password(password), role, status, contact, address),
             )
+        _invalidate_users_cache()
         return True
     except sqlite3.IntegrityError:
         return False
@@ -230,10 +476,39 @@ def add_user(
 # ==================== 数据存储管理模块 ====================
 
 
+# load_items() 返回的物品字典的键（与 SELECT 的列顺序一致）
+_ITEM_COLUMNS = (
+    "id",
+    "name",
+    "category",
+    "description",
+    "contact",
+    "image",
+    "create_time",
+    "attributes",
+)
+
+
+# insert_item/insert_items 共用同一条语句文本：sqlite3 的语句缓存按 SQL 文本匹配，
+# 文本完全相同才能复用同一个预编译语句
+_SQL_INSERT_ITEM = """
+INSERT INTO items (name, description, address, contact, create_time, category, image, attributes)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
 def load_items(DB_FILE):
+    """加载全部物品（带缓存，数据库文件未变化时直接返回上次结果）"""
     _ensure_db_schema(DB_FILE)
-    with _get_db_connection(DB_FILE) as conn:
-        rows = conn.execute(
+    key = _db_file_key(DB_FILE)
+    if key is not None and key == _items_cache["key"]:
+        return _items_cache["value"]
+
+    with _get_read_connection(DB_FILE) as conn:
+        # 这里按固定列顺序整行转换，用普通元组比 sqlite3.Row 逐列按名取值更快
+        cur = conn.cursor()
+        cur.row_factory = None
+        rows = cur.execute(
             """
             SELECT id, name, category, description, contact, image, create_time, attributes
             FROM items
@@ -241,30 +516,78 @@ def load_items(DB_FILE):
             """
         ).fetchall()
 
-    return [
-        {
-            "id": row["id"],
-            "name": row["name"],
-            "category": row["category"],
-            "description": row["description"],
-            "contact": row["contact"],
-            "image": row["image"],
-            "create_time": row["create_time"],
-            "attributes": row["attributes"],
-        }
-        for row in rows
-    ]
+    items = [dict(zip(_ITEM_COLUMNS, row)) for row in rows]
+
+    _items_cache["key"] = key
+    _items_cache["value"] = items
+    return items
+
 
+def insert_item(item: dict, DB_FILE, image_saver=None) -> int:
+    """新增一条物品记录，返回数据库分配的物品 ID（INTEGER PRIMARY KEY → lastrowid）。
 
-def save_items(items, DB_FILE):
-    # 为了保持原有“保存整个列表”的接口，这里采用覆盖写入表的方式。
-    # 实际业务中更推荐直接 INSERT/UPDATE/DELETE（本项目的 add_item/delete_item 已改为直接操作数据库）。
+    image_saver: 可选回调 image_saver(item_id) -> 图片路径。图片文件名要用到新 ID，
+                 因此在同一事务内先 INSERT 取得 lastrowid，再保存图片并回填 image 字段。
+
+    写入后不让整张表的缓存失效，而是把这条记录直接追加到 load_items() 的缓存中，
+    下一次读取无需重新 SELECT 全表（前提：缓存在写入前是最新的，否则照常失效）。
+    """
+    _ensure_db_schema(DB_FILE)
+    with _db_lock:
+        key_before = _db_file_key(DB_FILE)
+        image_path = item.get("image")
+        with _get_db_connection(DB_FILE) as conn:
+            cur = conn.execute(
+                _SQL_INSERT_ITEM,
+                (
+                    item.get("name"),
+                    item.get("description"),
+                    item.get("address"),
+                    item.get("contact"),
+                    item.get("create_time"),
+                    item.get("category"),
+                    image_path,
+                    item.get("attributes"),
+                ),
+            )
+            new_id = cur.lastrowid
+            if image_saver is not None:
+                image_path = image_saver(new_id)
+                conn.execute(
+                    "UPDATE items SET image = ? WHERE id = ?", (image_path, new_id)
+                )
+
+        if _items_cache["key"] is not None and _items_cache["key"] == key_before:
+            cached = {
+                "id": new_id,
+                "name": item.get("name"),
+                "category": item.get("category"),
+                "description": item.get("description"),
+                "contact": item.get("contact"),
+                "image": image_path,
+                "create_time": item.get("create_time"),
+                "attributes": item.get("attributes"),
+            }
+            # 复制后替换（而非原地 append），正在遍历旧列表的读者不受影响
+            _items_cache["value"] = _items_cache["value"] + [cached]
+            _items_cache["key"] = _db_file_key(DB_FILE)
+        else:
+            _invalidate_items_cache()
+    return new_id
+
+
+def insert_items(items, DB_FILE) -> int:
+    """批量新增物品（例如管理员批量导入），返回插入的条数。
+
+    所有记录在同一事务内用 executemany 写入，ID 由数据库分配；
+    与逐条调用 insert_item 相比，省去每行一次的提交与缓存维护。
+    """
     _ensure_db_schema(DB_FILE)
     rows = [
         (
-            item.get("id"),
             item.get("name"),
             item.get("description"),
+            item.get("address"),
             item.get("contact"),
             item.get("create_time"),
             item.get("category"),
@@ -273,13 +596,39 @@ def save_items(items, DB_FILE):
         )
         for item in items
     ]
+    if not rows:
+        return 0
 
     with _get_db_connection(DB_FILE) as conn:
-        conn.execute("DELETE FROM items")
-        conn.executemany(
-            """
-            INSERT INTO items (id, name, description, contact, create_time, category, image, attributes)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            rows,
-        )
+        conn.executemany(_SQL_INSERT_ITEM, rows)
+    _invalidate_items_cache()
+    return len(rows)
+
+
+def delete_item_record(item_id: int, DB_FILE) -> tuple[bool, str | None]:
+    """删除一条物品记录，返回 (是否存在, 图片路径)。
+
+    用 DELETE ... RETURNING 一条语句同时完成查找与删除（SQLite ≥ 3.35），
+    不再先 SELECT 再 DELETE；语句文本固定，可命中共享连接上的语句缓存。
+    删除后同步更新 load_items() 的缓存，而不是让整张表的缓存失效。
+    """
+    _ensure_db_schema(DB_FILE)
+    with _db_lock:
+        key_before = _db_file_key(DB_FILE)
+        with _get_db_connection(DB_FILE) as conn:
+            rows = conn.execute(
+                "DELETE FROM items WHERE id = ? RETURNING image", (item_id,)
+            ).fetchall()
+        if not rows:
+            return False, None
+
+        # 与 insert_item 相同：缓存在删除前是最新的，就直接从缓存列表中去掉这一条，
+        # 下一次 load_items() 无需重新 SELECT 全表（复制后替换，不原地修改）
+        if _items_cache["key"] is not None and _items_cache["key"] == key_before:
+            _items_cache["value"] = [
+                it for it in _items_cache["value"] if it["id"] != item_id
+            ]
+            _items_cache["key"] = _db_file_key(DB_FILE)
+        else:
+            _invalidate_items_cache()
+    return True, rows[0]["image"]
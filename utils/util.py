@@ -1,39 +1,40 @@
 import sys
 import os
+from functools import lru_cache
 
-
-def get_resource_path(relative_path):
-    """获取资源的绝对路径，兼容开发环境和打包后的环境"""
-    if hasattr(sys, "_MEIPASS"):
-        # PyInstaller 打包后的临时目录
-        return os.path.join(sys._MEIPASS, relative_path)
-    # 开发环境下的当前目录
-    return os.path.join(os.path.abspath("."), relative_path)
+# 基准目录在进程启动后不会变化，导入时计算一次：
+# - 读资源：PyInstaller 打包后为临时解压目录 sys._MEIPASS，开发环境为启动时的当前目录
+# - 写数据：打包后为 exe 所在目录，开发环境同样为启动时的当前目录
+#   （导入时记下当前目录，之后即使有代码调用 os.chdir，写入位置也不会跟着变）
+# print(os.path.abspath(".")) D:\数据库原理\物品复活\CS3331-Software-Engineering-Project1
+_CWD_AT_IMPORT = os.path.abspath(".")
+_READ_BASE = getattr(sys, "_MEIPASS", _CWD_AT_IMPORT)
+_WRITE_BASE = (
+    os.path.dirname(sys.executable) if getattr(sys, "frozen", False) else _CWD_AT_IMPORT
+)
 
 
+# 以下函数的结果在进程运行期间不会变化，且会被反复调用（category_config 每次读取配置都要取路径），
+# 因此按 relative_path 缓存结果
+@lru_cache(maxsize=None)
 def get_path_for_read(relative_path):
     """
     【读资源专用】
     获取资源文件的目录（兼容开发环境和打包后的临时目录）
     用来读：CSS, 图片, 默认配置
     """
-    if hasattr(sys, "_MEIPASS"):
-        return os.path.join(sys._MEIPASS, relative_path)
-    # print("__file__:", __file__) D:\数据库原理\物品复活\CS3331-Software-Engineering-Project1\utils\util.py
-    # print("os.path.abspath(__file__):", os.path.abspath(__file__)) D:\数据库原理\物品复活\CS3331-Software-Engineering-Project1\utils\util.py
-    # print(os.path.dirname(os.path.abspath("."))) D:\数据库原理\物品复活
-    # print(os.path.abspath(".")) D:\数据库原理\物品复活\CS3331-Software-Engineering-Project1
-    return os.path.join(os.path.abspath("."), relative_path)
+    return os.path.join(_READ_BASE, relative_path)
+
+
+# 旧名称：获取资源的绝对路径，与 get_path_for_read 完全相同（共用同一个缓存）
+get_resource_path = get_path_for_read
 
 
+@lru_cache(maxsize=None)
 def get_path_for_write(relative_path):
     """
     【写数据专用】
     获取 exe 所在的真实目录（用户能看到的目录）
     用来读写：数据库(.db), 日志(.log), 用户保存的文件
     """
-    if getattr(sys, "frozen", False):
-        # 如果是打包后的 exe，返回 exe 所在的文件夹
-        return os.path.join(os.path.dirname(sys.executable), relative_path)
-    # 如果是 py 代码运行，返回 main.py 所在的文件夹
-    return os.path.join(os.path.abspath("."), relative_path)
+    return os.path.join(_WRITE_BASE, relative_path)